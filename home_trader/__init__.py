@@ -1,3 +1,8 @@
 """Home Trader package."""
 
+from dotenv import load_dotenv
+
+# Load credentials from ``.env`` once per process, before any client reads them.
+_ = load_dotenv()
+
 __all__ = []
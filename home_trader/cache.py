@@ -0,0 +1,48 @@
+"""Short-lived caches for exchange data."""
+from __future__ import annotations
+
+import time
+from typing import Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+V = TypeVar("V")
+
+
+class TTLCache(Generic[V]):
+    """Maps keys to values that expire ``ttl_seconds`` after they are stored.
+
+    When ``max_entries`` is set, storing a new key beyond that size evicts the
+    oldest entry first.
+    """
+
+    def __init__(self, ttl_seconds: float, max_entries: Optional[int] = None) -> None:
+        self._ttl = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: Dict[Hashable, Tuple[V, float]] = {}
+
+    def get(self, key: Hashable) -> Optional[V]:
+        """Return the cached value for ``key`` or ``None`` if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if time.monotonic() >= expires_at:
+            self._entries.pop(key, None)
+            return None
+        return value
+
+    def set(self, key: Hashable, value: V) -> None:
+        """Store ``value`` under ``key``. A non-positive TTL disables caching."""
+        if self._ttl <= 0:
+            return
+        # Re-inserting moves the key to the end, so the first key is the oldest.
+        self._entries.pop(key, None)
+        if self._max_entries is not None and len(self._entries) >= self._max_entries:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (value, time.monotonic() + self._ttl)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Drop ``key`` from the cache, or every entry when no key is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
@@ -2,24 +2,43 @@
 
 from __future__ import annotations
 
+import asyncio
+import base64
+import functools
 import os
+import secrets
+import time
+from concurrent.futures import Executor
 from dataclasses import dataclass
-from typing import Any
+from typing import Any, Callable, Sequence, TypeVar
 
-from dotenv import load_dotenv
+import orjson
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
+
+from .cache import TTLCache
 
 try:
+    import jwt
+    from coinbase.constants import RATE_LIMIT_HEADERS, USER_AGENT
     from coinbase.rest import RESTClient
+    from coinbase.rest.rest_base import handle_exception
+    from cryptography.hazmat.primitives import serialization
+    from cryptography.hazmat.primitives.asymmetric import ec, ed25519
 except Exception as exc:  # pragma: no cover - import guard
     raise ImportError(
         "coinbase-advanced-py is required. Install it with `pip install coinbase-advanced-py`."
     ) from exc
 
-_ = load_dotenv()
+_MAX_POOL_SIZE = 8
+_ACCOUNTS_KEY = "accounts"
+
+_T = TypeVar("_T")
 
 
 class CoinbaseAuthError(RuntimeError):
-    """Raised when API credentials are missing."""
+    """Raised when API credentials are missing or malformed."""
 
 
 @dataclass
@@ -48,6 +67,9 @@ class CoinbaseClient:
         *,
         api_key: str | None = None,
         api_secret: str | None = None,
+        price_ttl_seconds: float = 2.0,
+        balance_ttl_seconds: float = 1.0,
+        timeout_seconds: float = 5.0,
     ) -> None:
         self._api_key: str | None = api_key or os.getenv("COINBASE_API_KEY")
         self._api_secret: str | None = api_secret or os.getenv("COINBASE_API_SECRET")
@@ -56,7 +78,27 @@ class CoinbaseClient:
                 "Coinbase API credentials are required. Set COINBASE_API_KEY and COINBASE_API_SECRET."
             )
 
-        self._client = RESTClient(api_key=self._api_key, api_secret=self._api_secret)
+        self._client = _RESTClient(
+            api_key=self._api_key, api_secret=self._api_secret, timeout=timeout_seconds
+        )
+        # The SDK keeps a ``requests.Session``; give it a sized, retrying pool so
+        # every REST call reuses an established TLS connection. The timeout keeps
+        # a stalled connection from pinning a pooled socket and a worker thread.
+        self._client.session.mount("https://", _build_adapter())
+        # Caches are per instance and keyed by product so one client never serves
+        # another's data. Balances are invalidated after every order.
+        self._price_cache: TTLCache[float] = TTLCache(price_ttl_seconds)
+        self._account_cache: TTLCache[dict[str, AccountBalance]] = TTLCache(balance_ttl_seconds)
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the SDK session."""
+        self._client.session.close()
+
+    def __enter__(self) -> "CoinbaseClient":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
 
     # ------------------------------------------------------------------
     # Public helpers
@@ -75,23 +117,61 @@ class CoinbaseClient:
                 )
         return accounts
 
+    def get_account_map(self) -> dict[str, AccountBalance]:
+        """Return available balances indexed by upper-cased asset symbol."""
+        cached = self._account_cache.get(_ACCOUNTS_KEY)
+        if cached is not None:
+            return cached
+        accounts = {account.asset.upper(): account for account in self.get_accounts()}
+        self._account_cache.set(_ACCOUNTS_KEY, accounts)
+        return accounts
+
     def get_usdc_balance(self) -> float:
         """Return the available USDC balance."""
-        for account in self.get_accounts():
-            if account.asset.upper() == "USDC":
-                return account.available_balance
-        return 0.0
+        return self.get_account_map().get("USDC", AccountBalance("USDC", 0.0)).available_balance
 
     def get_product_price(self, product_id: str) -> float:
         """Return the latest trade price for a product."""
-        payload = self._client.get_market_ticker(product_id=product_id)
+        return self.get_prices([product_id])[product_id]
+
+    def record_price(self, product_id: str, price: float) -> None:
+        """Cache a price observed elsewhere, such as on the WebSocket ticker."""
+        self._price_cache.set(product_id, price)
+
+    def get_prices(self, product_ids: Sequence[str], *, skip_missing: bool = False) -> dict[str, float]:
+        """Return the latest trade price for each product in a single request.
+
+        Products the exchange returns no price for raise ``RuntimeError`` unless
+        ``skip_missing`` is set, in which case they are left out of the result.
+        """
+        prices: dict[str, float] = {}
+        missing: list[str] = []
+        for product_id in product_ids:
+            cached = self._price_cache.get(product_id)
+            if cached is None:
+                missing.append(product_id)
+            else:
+                prices[product_id] = cached
+        if not missing:
+            return prices
+
+        payload = self._client.get_products(product_ids=missing)
         data = _unwrap(payload)
-        price = data.get("price")
-        if price is None:
+        wanted = set(missing)
+        for item in data.get("products", []):
+            product_id = item.get("product_id")
+            price = item.get("price")
+            if product_id in wanted and price:
+                value = float(price)
+                self._price_cache.set(product_id, value)
+                prices[product_id] = value
+
+        not_found = [product_id for product_id in missing if product_id not in prices]
+        if not_found and not skip_missing:
             raise RuntimeError(
-                f"Ticker response missing price for {product_id}: {payload}"
+                f"Products response missing price for {', '.join(not_found)}: {payload}"
             )
-        return float(price)
+        return prices
 
     def place_market_buy(
         self, product_id: str, quote_size: float, client_order_id: str
@@ -108,6 +188,7 @@ class CoinbaseClient:
             },
         }
         payload = self._client.create_order(**body)
+        self._account_cache.invalidate()
         return self._parse_order_result(_unwrap(payload))
 
     def place_market_sell(
@@ -125,6 +206,7 @@ class CoinbaseClient:
             },
         }
         payload = self._client.create_order(**body)
+        self._account_cache.invalidate()
         return self._parse_order_result(_unwrap(payload))
 
     # ------------------------------------------------------------------
@@ -152,25 +234,177 @@ class CoinbaseClient:
         )
 
 
+class AsyncCoinbaseClient:
+    """Awaitable facade over :class:`CoinbaseClient`.
+
+    The SDK is synchronous, so each call runs on ``executor`` (the loop's default
+    executor when omitted). The semaphore bounds how many requests are in flight
+    at once to respect rate limits.
+    """
+
+    def __init__(
+        self,
+        client: CoinbaseClient,
+        *,
+        semaphore: asyncio.Semaphore | None = None,
+        executor: Executor | None = None,
+    ) -> None:
+        self._client = client
+        self._semaphore = semaphore or asyncio.Semaphore(_MAX_POOL_SIZE)
+        self._executor = executor
+
+    def close(self) -> None:
+        """Release pooled HTTP connections held by the wrapped client."""
+        self._client.close()
+
+    def record_price(self, product_id: str, price: float) -> None:
+        self._client.record_price(product_id, price)
+
+    async def get_accounts(self) -> list[AccountBalance]:
+        return await self._call(self._client.get_accounts)
+
+    async def get_account_map(self) -> dict[str, AccountBalance]:
+        return await self._call(self._client.get_account_map)
+
+    async def get_usdc_balance(self) -> float:
+        return await self._call(self._client.get_usdc_balance)
+
+    async def get_product_price(self, product_id: str) -> float:
+        return await self._call(self._client.get_product_price, product_id)
+
+    async def get_prices(self, product_ids: Sequence[str], *, skip_missing: bool = False) -> dict[str, float]:
+        return await self._call(
+            functools.partial(self._client.get_prices, skip_missing=skip_missing), product_ids
+        )
+
+    async def place_market_buy(
+        self, product_id: str, quote_size: float, client_order_id: str
+    ) -> OrderResult:
+        return await self._call(
+            self._client.place_market_buy, product_id, quote_size, client_order_id
+        )
+
+    async def place_market_sell(
+        self, product_id: str, base_size: float, client_order_id: str
+    ) -> OrderResult:
+        return await self._call(
+            self._client.place_market_sell, product_id, base_size, client_order_id
+        )
+
+    async def _call(self, func: Callable[..., _T], *args: Any) -> _T:
+        loop = asyncio.get_running_loop()
+        async with self._semaphore:
+            return await loop.run_in_executor(self._executor, functools.partial(func, *args))
+
+
+class _RESTClient(RESTClient):
+    """SDK client that parses the API private key once instead of per request."""
+
+    def __init__(self, *, api_key: str, api_secret: str, timeout: float) -> None:
+        super().__init__(api_key=api_key, api_secret=api_secret, timeout=timeout)
+        # Static headers live on the session; set_headers only adds the JWT.
+        # urllib3's ACCEPT_ENCODING lists only codecs it can decode here.
+        self.session.headers.update(
+            {
+                "User-Agent": USER_AGENT,
+                "Content-Type": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING,
+                "Connection": "keep-alive",
+            }
+        )
+        try:
+            self._signing_key, self._signing_algorithm = _load_signing_key(self.api_secret)
+        except (TypeError, ValueError) as exc:
+            raise CoinbaseAuthError(
+                "COINBASE_API_SECRET must be a PEM EC private key or a base64 Ed25519 key."
+            ) from exc
+
+    def set_headers(self, method: str, path: str) -> dict[str, str]:
+        now = int(time.time())
+        claims = {
+            "sub": self.api_key,
+            "iss": "cdp",
+            "nbf": now,
+            "exp": now + 120,
+            "uri": f"{method} {self.base_url}{path}",
+        }
+        token = jwt.encode(
+            claims,
+            self._signing_key,
+            algorithm=self._signing_algorithm,
+            headers={"kid": self.api_key, "nonce": secrets.token_hex()},
+        )
+        return {"Authorization": f"Bearer {token}"}
+
+    def send_request(
+        self,
+        http_method: str,
+        url_path: str,
+        params: dict[str, Any] | None,
+        headers: dict[str, str],
+        data: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        # Encode the body once in compact form and decode the response once; the
+        # SDK version re-encodes via ``json=`` and parses every response twice.
+        body = orjson.dumps(data or {})
+        response = self.session.request(
+            http_method,
+            f"https://{self.base_url}{url_path}",
+            params=params,
+            data=body,
+            headers=headers,
+            timeout=self.timeout,
+        )
+        handle_exception(response)
+        response_data = orjson.loads(response.content)
+        if self.rate_limit_headers:
+            response_data.update(
+                {key: response.headers.get(key) for key in RATE_LIMIT_HEADERS}
+            )
+        return response_data
+
+
+def _load_signing_key(secret: str) -> tuple[Any, str]:
+    """Parse an API secret into a private key and its JWT algorithm."""
+
+    if secret.lstrip().startswith("-----BEGIN"):
+        key = serialization.load_pem_private_key(secret.encode("utf-8"), password=None)
+        if not isinstance(key, ec.EllipticCurvePrivateKey):
+            raise ValueError(f"Unsupported PEM key type: {type(key).__name__}")
+        return key, "ES256"
+    raw = base64.b64decode("".join(secret.split()), validate=True)
+    if len(raw) not in (32, 64):
+        raise ValueError(f"Ed25519 key must decode to 32 or 64 bytes, got {len(raw)}")
+    return ed25519.Ed25519PrivateKey.from_private_bytes(raw[:32]), "EdDSA"
+
+
+def _build_adapter() -> HTTPAdapter:
+    """Return a pooled HTTP adapter that retries throttled or failed requests."""
+
+    retry = Retry(
+        total=3,
+        backoff_factor=0.2,
+        status_forcelist=(429, 500, 502, 503, 504),
+    )
+    return HTTPAdapter(pool_connections=4, pool_maxsize=_MAX_POOL_SIZE, max_retries=retry)
+
+
 def _unwrap(response: Any) -> dict[str, Any]:
     """Extract the raw payload from an SDK API response."""
 
-    if isinstance(response, dict):
-        return response
     data = getattr(response, "data", None)
+    if data is None:
+        data = response
     if isinstance(data, dict):
         return data
+    if hasattr(data, "to_dict"):
+        # SDK response objects; converts nested response objects too.
+        return data.to_dict()  # type: ignore[no-any-return]
     if hasattr(data, "model_dump"):
         return data.model_dump()  # type: ignore[no-any-return]
-    if hasattr(data, "dict"):
-        return data.dict()  # type: ignore[no-any-return]
     if isinstance(data, list):
         return {"data": data}
-    if data is not None:
-        nested = getattr(data, "__dict__", None)
-        if isinstance(nested, dict):
-            return nested
-    raw = getattr(response, "__dict__", None)
-    if isinstance(raw, dict):
-        return raw
+    nested = getattr(data, "__dict__", None)
+    if isinstance(nested, dict):
+        return nested
     return {}
@@ -4,7 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import timedelta
 from pathlib import Path
-from typing import List, Sequence
+from typing import FrozenSet, Sequence
 
 
 DEFAULT_FORBIDDEN_PRODUCTS: Sequence[str] = ("SOL", "SUI", "BTC", "ETH")
@@ -17,6 +17,20 @@ class LLMConfig:
     model: str = "llama3"
     endpoint: str = "http://localhost:11434/api/generate"
     temperature: float = 0.2
+    max_context_bytes: int = 16_384
+    # Keep this several polling intervals long, or a cached hold expires before reuse.
+    hold_cache_ttl_seconds: float = 300.0
+
+
+@dataclass(frozen=True)
+class CoinbaseConfig:
+    """Client-side caching, timeouts, and streaming for Coinbase market and account data."""
+
+    request_timeout_seconds: float = 5.0
+    price_cache_ttl_seconds: float = 2.0
+    balance_cache_ttl_seconds: float = 1.0
+    stream_prices: bool = True
+    price_move_threshold: float = 0.005
 
 
 @dataclass(frozen=True)
@@ -44,10 +58,12 @@ class AgentConfig:
     """Aggregate configuration for the trading agent."""
 
     llm: LLMConfig = LLMConfig()
+    coinbase: CoinbaseConfig = CoinbaseConfig()
     constraints: TradingConstraints = TradingConstraints()
     journal: JournalConfig = JournalConfig()
     polling_interval_seconds: int = 60
+    forbidden_products: FrozenSet[str] = field(init=False, repr=False, compare=False)
 
-    @property
-    def forbidden_products(self) -> List[str]:
-        return [p.upper() for p in self.constraints.forbidden_products]
+    def __post_init__(self) -> None:
+        forbidden = frozenset(p.upper() for p in self.constraints.forbidden_products)
+        object.__setattr__(self, "forbidden_products", forbidden)
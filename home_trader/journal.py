@@ -1,10 +1,82 @@
 """Utilities for managing the trading journal."""
 from __future__ import annotations
 
-from dataclasses import dataclass
-from datetime import datetime
+import queue
+import re
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+_TAIL_MAX_ENTRIES = 256
+_WRITE_BATCH = 64
+_ENTRY_BOUNDARY = re.compile(r"(?m)^(?=## )")
+
+_last_ts_sec = 0
+_last_ts_str = ""
+
+
+def _now_iso() -> str:
+    """Return the current UTC time, formatting at most once per second."""
+    global _last_ts_sec, _last_ts_str
+    now = int(time.time())
+    if now != _last_ts_sec:
+        _last_ts_str = datetime.fromtimestamp(now, timezone.utc).strftime("%Y-%m-%dT%H:%M:%S")
+        _last_ts_sec = now
+    return _last_ts_str
+
+
+class _JournalWriter:
+    """Appends entries to the journal file from a background thread.
+
+    Entries queued while a write is in progress are batched into the next one,
+    so the trading loop never waits on the disk. ``SimpleQueue`` keeps each
+    enqueue to a single unbounded, C-level append.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._queue: "queue.SimpleQueue[Optional[str]]" = queue.SimpleQueue()
+        self._error: Optional[BaseException] = None
+        self._error_raised = False
+        self._thread = threading.Thread(target=self._run, args=(path,), name="journal-writer", daemon=True)
+        self._thread.start()
+
+    def write(self, entry: str) -> None:
+        """Queue ``entry``, raising the writer's error if an earlier write failed."""
+        # A failed write stops the thread, so nothing would reach the disk again;
+        # fail the caller's next journal call instead of trading on unrecorded.
+        if self._error is not None:
+            self._error_raised = True
+            raise self._error
+        self._queue.put_nowait(entry)
+
+    def close(self) -> None:
+        """Write out every queued entry, then stop the thread."""
+        self._queue.put_nowait(None)
+        self._thread.join()
+        if self._error is not None and not self._error_raised:
+            raise self._error
+
+    def _run(self, path: Path) -> None:
+        try:
+            with path.open("a", encoding="utf-8") as handle:
+                while True:
+                    batch: List[Optional[str]] = [self._queue.get()]
+                    while len(batch) < _WRITE_BATCH:
+                        try:
+                            batch.append(self._queue.get_nowait())
+                        except queue.Empty:
+                            break
+                    handle.write("".join(entry for entry in batch if entry is not None))
+                    # Flush per batch so a crash loses at most what was still queued.
+                    handle.flush()
+                    if None in batch:
+                        return
+        except BaseException as exc:  # surfaced to the caller by close()
+            self._error = exc
 
 
 @dataclass
@@ -12,6 +84,36 @@ class Journal:
     """Represents the journal file tracking all trade activity."""
 
     path: Path
+    _writer: Optional[_JournalWriter] = field(default=None, init=False, repr=False)
+    # Recent entries paired with their UTF-8 size, measured once when appended.
+    _tail: Deque[Tuple[str, int]] = field(
+        default_factory=lambda: deque(maxlen=_TAIL_MAX_ENTRIES), init=False, repr=False
+    )
+    _complete: bool = field(default=True, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        # Resuming an existing journal: seed the in-memory tail from disk once.
+        if self.path.exists():
+            text = self.path.read_text(encoding="utf-8")
+            for chunk in _ENTRY_BOUNDARY.split(text):
+                if chunk:
+                    self._remember(chunk)
+
+    def _remember(self, entry: str) -> None:
+        if len(self._tail) == self._tail.maxlen:
+            # The oldest entry is about to drop out of memory.
+            self._complete = False
+        self._tail.append((entry, len(entry.encode("utf-8"))))
+
+    def __enter__(self) -> "Journal":
+        """Hand appends to a background writer until the context exits."""
+        self._writer = _JournalWriter(self.path)
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        writer, self._writer = self._writer, None
+        if writer is not None:
+            writer.close()
 
     def log_header(self, metadata: Dict[str, Any]) -> None:
         """Initialize the journal with a header containing session metadata."""
@@ -27,32 +129,61 @@ class Journal:
                 f"Forbidden Products: {', '.join(metadata.get('forbidden_products', []))}\n",
                 "\n",
             ]
-            self.path.write_text("".join(header_lines), encoding="utf-8")
+            header = "".join(header_lines)
+            self.path.write_text(header, encoding="utf-8")
+            self._remember(header)
 
     def append_entry(self, heading: str, content: str) -> None:
         """Append a markdown-formatted entry to the journal."""
-        timestamp = datetime.utcnow().isoformat()
-        entry_lines = [
-            f"## {heading} ({timestamp} UTC)\n",
-            "\n",
-            f"{content}\n",
-            "\n",
-        ]
+        entry = f"## {heading} ({_now_iso()} UTC)\n\n{content}\n\n"
+        self._remember(entry)
+        if self._writer is not None:
+            self._writer.write(entry)
+            return
         with self.path.open("a", encoding="utf-8") as handle:
-            handle.writelines(entry_lines)
+            handle.write(entry)
 
     def append_transaction(self, transaction: Dict[str, Any]) -> None:
         """Append a transaction record to the journal."""
         details = "\n".join(f"- **{key}**: {value}" for key, value in transaction.items())
         self.append_entry("Transaction", details)
 
-    def append_decision(self, decision: str, rationale: str) -> None:
-        """Log the LLM's decision and rationale."""
+    def append_decision(self, decision: str, rationale: str, *, cached: bool = False) -> None:
+        """Log the LLM's decision and rationale.
+
+        A ``cached`` decision was reused for an unchanged market rather than
+        freshly answered, and is headed as such.
+        """
         content = f"- **Decision**: {decision}\n- **Rationale**: {rationale}"
-        self.append_entry("Decision", content)
+        self.append_entry("Decision (cached)" if cached else "Decision", content)
+
+    def tail(self, max_bytes: int = 16_384) -> str:
+        """Return the most recent whole entries that fit within ``max_bytes``.
+
+        A newest entry larger than the budget on its own is cut to its first
+        ``max_bytes``.
+        """
+        chunks = []
+        used = 0
+        for chunk, size in reversed(self._tail):
+            if used + size > max_bytes:
+                if not chunks:
+                    # The newest entry alone is over budget; keep its start,
+                    # heading included, rather than sending no journal at all.
+                    chunks.append(chunk.encode("utf-8")[:max_bytes].decode("utf-8", "ignore"))
+                break
+            chunks.append(chunk)
+            used += size
+        return "".join(reversed(chunks))
 
     def read_contents(self) -> str:
-        """Read the entire journal contents for use as LLM context."""
+        """Return the entire journal contents.
+
+        Served from memory while every entry is still held there; otherwise the
+        file is read from disk, without entries still queued for the writer.
+        """
+        if self._complete:
+            return "".join(chunk for chunk, _ in self._tail)
         if self.path.exists():
             return self.path.read_text(encoding="utf-8")
         return ""
@@ -61,7 +192,7 @@ class Journal:
 def create_journal(directory: Path, prefix: str, extension: str) -> Journal:
     """Create a journal file with a timestamped name."""
     directory.mkdir(parents=True, exist_ok=True)
-    timestamp = datetime.utcnow().strftime("%Y%m%dT%H%M%SZ")
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
     filename = f"{prefix}_{timestamp}{extension}"
     path = directory / filename
     return Journal(path=path)
@@ -1,14 +1,76 @@
 """Tools for interacting with a local Ollama model."""
 from __future__ import annotations
 
-import json
-from dataclasses import dataclass
-from typing import Any, Dict, Optional
+import asyncio
+import functools
+import hashlib
+import math
+import re
+import threading
+from concurrent.futures import Executor
+from dataclasses import dataclass, replace
+from typing import Any, Callable, Dict, List, Optional
 
+import orjson
 import requests
 
+from .cache import TTLCache
 from .config import LLMConfig
 
+# Static prompt text is built once; only the session data is formatted per cycle.
+_PROMPT_INTRO = "You are an autonomous crypto trading strategist.\n\nSession constraints:\n"
+_PROMPT_INSTRUCTIONS = """
+
+Respond with strict JSON using the schema:
+{
+  "action": "buy" | "sell" | "hold",
+  "product_id": string | null,
+  "amount_usdc": number | null,
+  "rationale": string
+}
+
+Explain your reasoning in the rationale field. Respect every constraint. Return `hold` when unsure."""
+
+# Leading fields of a reply that is still streaming, used for early notification.
+_PARTIAL_ACTION = re.compile(r'"action"\s*:\s*"(\w+)"')
+_PARTIAL_PRODUCT = re.compile(r'"product_id"\s*:\s*(?:"([^"]*)"|null)')
+
+PartialCallback = Callable[[str, Optional[str]], None]
+
+_HOLD_CACHE_ENTRIES = 64
+
+# Passed as Ollama's ``format`` so decoding is constrained to a well-formed decision:
+# a hold carries no trade, and a trade always names a product and a size.
+_DECISION_SCHEMA: Dict[str, Any] = {
+    "anyOf": [
+        {
+            "type": "object",
+            "properties": {
+                "action": {"const": "hold"},
+                "product_id": {"type": "null"},
+                "amount_usdc": {"type": "null"},
+                "rationale": {"type": "string"},
+            },
+            "required": ["action", "product_id", "amount_usdc", "rationale"],
+        },
+        {
+            "type": "object",
+            "properties": {
+                "action": {"enum": ["buy", "sell"]},
+                "product_id": {"type": "string", "minLength": 1},
+                "amount_usdc": {"type": "number", "exclusiveMinimum": 0},
+                "rationale": {"type": "string"},
+            },
+            "required": ["action", "product_id", "amount_usdc", "rationale"],
+        },
+    ]
+}
+_ACTIONS = frozenset({"buy", "sell", "hold"})
+
+
+class DecisionCancelled(RuntimeError):
+    """Raised when a decision is abandoned through its ``cancel`` event."""
+
 
 @dataclass
 class LLMDecision:
@@ -18,73 +80,209 @@ class LLMDecision:
     product_id: Optional[str]
     amount_usdc: Optional[float]
     rationale: str
+    # True when reused from the hold cache rather than answered by the LLM.
+    cached: bool = False
 
 
 class LLMDecisionMaker:
     """Wrapper around the Ollama HTTP API for trading decisions."""
 
-    def __init__(self, config: LLMConfig) -> None:
+    def __init__(self, config: LLMConfig, *, price_resolution: float = 0.0) -> None:
         self._config = config
+        self._session = requests.Session()
+        # Holds are remembered per market state so an unchanged market is not
+        # re-asked every polling interval. Prices enter the key in log buckets
+        # ``price_resolution`` wide, so only a move of about that size counts
+        # as a new state.
+        self._bucket_width = math.log1p(price_resolution) if price_resolution > 0 else 0.0
+        self._holds: TTLCache[LLMDecision] = TTLCache(config.hold_cache_ttl_seconds, _HOLD_CACHE_ENTRIES)
+
+    def close(self) -> None:
+        """Release the pooled HTTP connection to Ollama."""
+        self._session.close()
 
-    def decide(self, *, journal_contents: str, market_snapshot: Dict[str, Any], constraints: Dict[str, Any]) -> LLMDecision:
-        """Ask the LLM for a decision based on the journal and market snapshot."""
+    def decide(
+        self,
+        *,
+        journal_contents: str,
+        market_snapshot: Dict[str, Any],
+        constraints: Dict[str, Any],
+        on_partial: Optional[PartialCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> LLMDecision:
+        """Ask the LLM for a decision based on the journal and market snapshot.
+
+        ``on_partial`` is called at most once, from the calling thread, with the
+        action and product id as soon as both have streamed in, so callers can
+        start work before the rationale finishes generating.
+
+        Setting ``cancel`` from another thread closes the stream at the next chunk
+        and raises :class:`DecisionCancelled`.
+
+        A ``hold`` is reused for the same balances, positions, constraints, and
+        bucketed prices until ``hold_cache_ttl_seconds`` pass. The journal is
+        left out of the key because every logged decision changes it.
+        """
+        key = self._cache_key(market_snapshot, constraints)
+        cached = self._holds.get(key)
+        if cached is not None:
+            return replace(cached, cached=True)
         prompt = self._build_prompt(journal_contents, market_snapshot, constraints)
         payload = {
             "model": self._config.model,
             "prompt": prompt,
             "options": {"temperature": self._config.temperature},
-            "stream": False,
+            "format": _DECISION_SCHEMA,
+            "stream": True,
         }
-        response = requests.post(self._config.endpoint, json=payload, timeout=30)
-        response.raise_for_status()
-        data = response.json()
-        raw_reply = data.get("response") or data.get("message") or ""
-        return self._parse_response(raw_reply)
+        body = orjson.dumps(payload)
+        with self._session.post(
+            self._config.endpoint,
+            data=body,
+            headers={"Content-Type": "application/json"},
+            stream=True,
+            timeout=60,
+        ) as response:
+            response.raise_for_status()
+            raw_reply = self._read_stream(response, on_partial, cancel)
+        decision = self._parse_response(raw_reply)
+        if decision.action == "hold":
+            self._holds.set(key, decision)
+        return decision
 
-    def _build_prompt(self, journal_contents: str, market_snapshot: Dict[str, Any], constraints: Dict[str, Any]) -> str:
-        """Build the prompt sent to the LLM."""
-        constraints_text = json.dumps(constraints, indent=2)
-        snapshot_text = json.dumps(market_snapshot, indent=2)
-        prompt = f"""
-You are an autonomous crypto trading strategist.
+    async def adecide(
+        self,
+        *,
+        journal_contents: str,
+        market_snapshot: Dict[str, Any],
+        constraints: Dict[str, Any],
+        executor: Optional[Executor] = None,
+        on_partial: Optional[PartialCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> LLMDecision:
+        """Run :meth:`decide` on ``executor`` so the event loop stays responsive.
 
-Session constraints:
-{constraints_text}
+        ``on_partial`` runs on the worker thread; hand work back to the loop with
+        ``call_soon_threadsafe``.
+        """
+        call = functools.partial(
+            self.decide,
+            journal_contents=journal_contents,
+            market_snapshot=market_snapshot,
+            constraints=constraints,
+            on_partial=on_partial,
+            cancel=cancel,
+        )
+        return await asyncio.get_running_loop().run_in_executor(executor, call)
 
-Recent market snapshot:
-{snapshot_text}
+    def _read_stream(
+        self,
+        response: requests.Response,
+        on_partial: Optional[PartialCallback] = None,
+        cancel: Optional[threading.Event] = None,
+    ) -> str:
+        """Accumulate streamed tokens, stopping as soon as they form a JSON object.
 
-Trading journal:
-{journal_contents}
+        Leaving the ``with`` block early closes the connection, which tells Ollama
+        to stop generating anything after the closing brace.
+        """
+        parts: List[str] = []
+        for line in response.iter_lines():
+            if cancel is not None and cancel.is_set():
+                raise DecisionCancelled("Decision cancelled while streaming.")
+            if not line:
+                continue
+            chunk = orjson.loads(line)
+            text = chunk.get("response") or ""
+            parts.append(text)
+            if on_partial is not None and '"' in text and self._notify_partial("".join(parts), on_partial):
+                on_partial = None
+            if "}" in text:
+                reply = "".join(parts)
+                try:
+                    orjson.loads(reply)
+                except orjson.JSONDecodeError:
+                    pass
+                else:
+                    return reply
+            if chunk.get("done"):
+                break
+        return "".join(parts)
 
-Respond with strict JSON using the schema:
-{{
-  "action": "buy" | "sell" | "hold",
-  "product_id": string | null,
-  "amount_usdc": number | null,
-  "rationale": string
-}}
+    @staticmethod
+    def _notify_partial(reply: str, on_partial: PartialCallback) -> bool:
+        """Report the streamed action and product id once both are known."""
+        action = _PARTIAL_ACTION.search(reply)
+        if action is None:
+            return False
+        action_name = action.group(1).lower()
+        if action_name == "hold":
+            on_partial(action_name, None)
+            return True
+        product = _PARTIAL_PRODUCT.search(reply)
+        if product is None:
+            return False
+        on_partial(action_name, product.group(1))
+        return True
 
-Explain your reasoning in the rationale field. Respect every constraint. Return `hold` when unsure.
-"""
-        return prompt.strip()
+    def _cache_key(self, market_snapshot: Dict[str, Any], constraints: Dict[str, Any]) -> bytes:
+        # Trades change the ledger fields in ``constraints``, so they never reuse a hold.
+        state = dict(market_snapshot)
+        prices = state.get("prices")
+        if self._bucket_width and prices:
+            state["prices"] = {
+                product_id: round(math.log(price) / self._bucket_width) if price > 0 else price
+                for product_id, price in prices.items()
+            }
+        canonical = orjson.dumps([state, constraints], option=orjson.OPT_SORT_KEYS)
+        return hashlib.blake2b(canonical, digest_size=16).digest()
+
+    def _build_prompt(self, journal_contents: str, market_snapshot: Dict[str, Any], constraints: Dict[str, Any]) -> str:
+        """Build the prompt sent to the LLM."""
+        constraints_text = orjson.dumps(constraints).decode("utf-8")
+        snapshot_text = orjson.dumps(market_snapshot).decode("utf-8")
+        return "".join(
+            (
+                _PROMPT_INTRO,
+                constraints_text,
+                "\n\nRecent market snapshot:\n",
+                snapshot_text,
+                "\n\nTrading journal:\n",
+                journal_contents,
+                _PROMPT_INSTRUCTIONS,
+            )
+        )
 
     def _parse_response(self, reply: str) -> LLMDecision:
-        """Parse the LLM response into a :class:`LLMDecision`."""
+        """Parse the LLM response into a :class:`LLMDecision`.
+
+        Raises ``ValueError`` for replies that do not match the decision schema,
+        in case the server ignored the constrained format.
+        """
         try:
-            data = json.loads(reply)
-        except json.JSONDecodeError as exc:  # pragma: no cover - defensive programming
+            data = orjson.loads(reply)
+        except orjson.JSONDecodeError as exc:
             raise ValueError(f"LLM returned non-JSON response: {reply}") from exc
+        if not isinstance(data, dict):
+            raise ValueError(f"LLM returned a non-object response: {reply}")
 
-        action = (data.get("action") or "hold").lower()
+        action = data.get("action") or "hold"
         product_id = data.get("product_id")
         amount_usdc = data.get("amount_usdc")
-        rationale = data.get("rationale") or "No rationale provided."
+        rationale = str(data.get("rationale") or "No rationale provided.")
 
-        if amount_usdc is not None:
-            try:
-                amount_usdc = float(amount_usdc)
-            except (TypeError, ValueError) as exc:  # pragma: no cover - defensive
-                raise ValueError(f"Invalid amount_usdc: {amount_usdc}") from exc
+        if not isinstance(action, str) or action.lower() not in _ACTIONS:
+            raise ValueError(f"Unsupported action: {action}")
+        action = action.lower()
+        if action == "hold":
+            return LLMDecision(action=action, product_id=None, amount_usdc=None, rationale=rationale)
+        if not isinstance(product_id, str) or not product_id:
+            raise ValueError(f"Trade decision does not specify a product: {product_id!r}")
+        # JSON numbers only: bool is an int subclass, and strings would parse too.
+        if isinstance(amount_usdc, bool) or not isinstance(amount_usdc, (int, float)):
+            raise ValueError(f"Invalid amount_usdc: {amount_usdc!r}")
+        amount_usdc = float(amount_usdc)
+        if not math.isfinite(amount_usdc) or amount_usdc <= 0:
+            raise ValueError(f"Invalid amount_usdc: {amount_usdc}")
 
         return LLMDecision(action=action, product_id=product_id, amount_usdc=amount_usdc, rationale=rationale)
@@ -10,24 +10,26 @@ from .config import AgentConfig
 from .journal import create_journal
 from .trading_agent import TradingAgent
 
+_DEFAULT_CONFIG = AgentConfig()
+
 
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(description="Autonomous crypto trading agent")
     parser.add_argument(
         "--model",
-        default=AgentConfig().llm.model,
+        default=_DEFAULT_CONFIG.llm.model,
         help="Name of the Ollama model to use",
     )
     parser.add_argument(
         "--poll-interval",
         type=int,
-        default=AgentConfig().polling_interval_seconds,
+        default=_DEFAULT_CONFIG.polling_interval_seconds,
         help="Seconds to wait between decision cycles",
     )
     parser.add_argument(
         "--journal-dir",
         type=Path,
-        default=AgentConfig().journal.directory,
+        default=_DEFAULT_CONFIG.journal.directory,
         help="Directory where journal files are stored",
     )
     return parser
@@ -37,15 +39,20 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
-    config = AgentConfig()
-    config = replace(config, polling_interval_seconds=args.poll_interval)
-    config = replace(config, llm=replace(config.llm, model=args.model))
-    config = replace(config, journal=replace(config.journal, directory=args.journal_dir))
+    config = replace(
+        _DEFAULT_CONFIG,
+        polling_interval_seconds=args.poll_interval,
+        llm=replace(_DEFAULT_CONFIG.llm, model=args.model),
+        journal=replace(_DEFAULT_CONFIG.journal, directory=args.journal_dir),
+    )
 
     journal = create_journal(config.journal.directory, config.journal.prefix, config.journal.extension)
     agent = TradingAgent(config)
-    agent.initialize_session(journal)
-    agent.run()
+    try:
+        agent.initialize_session(journal)
+        agent.run_sync()
+    finally:
+        agent.close()
     return 0
 
 
@@ -0,0 +1,105 @@
+"""Coinbase WebSocket ticker feed used to wake the decision loop on price moves."""
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Optional, Set
+
+import orjson
+
+try:
+    from coinbase.websocket import WSClient, WSClientConnectionClosedException, WSClientException
+except Exception as exc:  # pragma: no cover - import guard
+    raise ImportError(
+        "coinbase-advanced-py is required. Install it with `pip install coinbase-advanced-py`."
+    ) from exc
+
+_WS_ERRORS = (WSClientException, WSClientConnectionClosedException, OSError)
+
+
+class MarketStreamError(RuntimeError):
+    """Raised when the ticker socket cannot be opened or subscribed."""
+
+
+@dataclass(frozen=True)
+class MarketEvent:
+    """A price move large enough to warrant a fresh decision."""
+
+    product_id: str
+    price: float
+
+
+class CoinbaseWSClient:
+    """Streams public ticker updates and queues significant price moves.
+
+    The SDK runs the socket on its own thread, so each tick is handed back to the
+    agent's event loop with ``call_soon_threadsafe``. Every price is forwarded to
+    ``on_price``; an event is queued only when a product moves at least
+    ``move_threshold`` (as a fraction) away from the last price that produced one.
+    """
+
+    def __init__(self, *, on_price: Callable[[str, float], None], move_threshold: float) -> None:
+        self.events: asyncio.Queue[MarketEvent] = asyncio.Queue()
+        self._on_price = on_price
+        self._move_threshold = move_threshold
+        self._reference: Dict[str, float] = {}
+        self._products: Set[str] = set()
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        # The ticker channel is public, so the socket is opened unauthenticated.
+        self._ws = WSClient(api_key=None, api_secret=None, on_message=self._on_message)
+
+    async def open(self) -> None:
+        """Connect the socket; subscriptions are added through :meth:`track`."""
+        self._loop = asyncio.get_running_loop()
+        await self._call(self._ws.open)
+
+    async def close(self) -> None:
+        """Disconnect the socket and stop the SDK's background thread."""
+        self._loop = None
+        await self._call(self._ws.close)
+
+    async def track(self, product_ids: Iterable[str]) -> None:
+        """Subscribe to ``product_ids`` and unsubscribe products no longer listed."""
+        wanted = set(product_ids)
+        added = sorted(wanted - self._products)
+        removed = sorted(self._products - wanted)
+        if added:
+            await self._call(self._ws.ticker, added)
+        if removed:
+            await self._call(self._ws.ticker_unsubscribe, removed)
+            for product_id in removed:
+                self._reference.pop(product_id, None)
+        self._products = wanted
+
+    async def _call(self, func: Callable[..., None], *args: object) -> None:
+        # The SDK's socket methods block until its own loop finishes the work.
+        try:
+            await asyncio.to_thread(func, *args)
+        except _WS_ERRORS as exc:
+            raise MarketStreamError(str(exc)) from exc
+
+    def _on_message(self, message: str) -> None:
+        # Runs on the SDK's socket thread.
+        loop = self._loop
+        if loop is None:
+            return
+        data = orjson.loads(message)
+        if data.get("channel") != "ticker":
+            return
+        for event in data.get("events", []):
+            for ticker in event.get("tickers", []):
+                product_id = ticker.get("product_id")
+                price = ticker.get("price")
+                if product_id and price:
+                    loop.call_soon_threadsafe(self._record, product_id, float(price))
+
+    def _record(self, product_id: str, price: float) -> None:
+        # Runs on the agent's event loop.
+        self._on_price(product_id, price)
+        reference = self._reference.get(product_id)
+        if reference is None:
+            self._reference[product_id] = price
+            return
+        if abs(price - reference) >= reference * self._move_threshold:
+            self._reference[product_id] = price
+            self.events.put_nowait(MarketEvent(product_id=product_id, price=price))
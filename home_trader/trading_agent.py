@@ -1,17 +1,41 @@
 """Core trading agent orchestration."""
 from __future__ import annotations
 
-import json
+import asyncio
+import contextlib
+import threading
 import time
 import uuid
+from array import array
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Awaitable, Dict, FrozenSet, List, Mapping, Optional, Tuple
 
-from .coinbase_client import CoinbaseClient
+import orjson
+
+from .cache import TTLCache
+from .coinbase_client import AccountBalance, AsyncCoinbaseClient, CoinbaseClient
 from .config import AgentConfig
 from .journal import Journal
-from .llm import LLMDecisionMaker
+from .llm import DecisionCancelled, LLMDecisionMaker
+from .market_stream import CoinbaseWSClient, MarketStreamError
+
+_MAX_WORKERS = 8
+_QUOTE_SUFFIX = "-USDC"
+# How long a product the exchange returned no price for is left out of price fetches.
+_UNPRICED_RECHECK_SECONDS = 600.0
+
+
+@lru_cache(maxsize=256)
+def _canon_product(product_id: str) -> Tuple[str, str]:
+    """Return the USDC product id and its base asset for an LLM-supplied id."""
+    product_id = product_id.upper()
+    if not product_id.endswith(_QUOTE_SUFFIX):
+        product_id = f"{product_id}{_QUOTE_SUFFIX}"
+    return product_id, product_id.split("-", 1)[0]
 
 
 @dataclass
@@ -21,115 +45,393 @@ class MarketSnapshot:
     usdc_balance: float
     open_positions: Dict[str, float]
     candidate_products: List[str]
+    prices: Dict[str, float]
 
     def to_dict(self) -> Dict[str, Any]:
         return {
             "usdc_balance": self.usdc_balance,
             "open_positions": self.open_positions,
             "candidate_products": self.candidate_products,
+            "prices": self.prices,
+        }
+
+
+@dataclass(frozen=True, slots=True)
+class TradeRecord:
+    """An executed trade as recorded in the ledger and the journal."""
+
+    order_id: str
+    status: str
+    product_id: str
+    action: str
+    amount_usdc: float
+    filled_size: Optional[float]
+    avg_price: Optional[float]
+    net_delta_usdc: float
+    timestamp_ns: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "order_id": self.order_id,
+            "status": self.status,
+            "product_id": self.product_id,
+            "action": self.action,
+            "amount_usdc": self.amount_usdc,
+            "filled_size": self.filled_size,
+            "avg_price": self.avg_price,
+            "net_delta_usdc": self.net_delta_usdc,
+            "timestamp_ns": self.timestamp_ns,
         }
 
 
 @dataclass
 class TradeLedger:
-    """Tracks realized profit and transaction count."""
+    """Tracks realized profit and transaction count.
 
-    net_profit_usdc: float = 0.0
-    transactions: List[Dict[str, Any]] = field(default_factory=list)
+    Trades are stored column-wise so totals and per-field scans walk one typed
+    array instead of a list of dicts.
+    """
 
-    def register_trade(self, trade: Dict[str, Any]) -> None:
-        self.transactions.append(trade)
-        delta = float(trade.get("net_delta_usdc", 0.0))
-        self.net_profit_usdc += delta
+    net_profit_usdc: float = 0.0
+    order_ids: List[str] = field(default_factory=list)
+    statuses: List[str] = field(default_factory=list)
+    product_ids: List[str] = field(default_factory=list)
+    actions: List[str] = field(default_factory=list)
+    amounts_usdc: array = field(default_factory=lambda: array("d"))
+    filled_sizes: List[Optional[float]] = field(default_factory=list)
+    avg_prices: List[Optional[float]] = field(default_factory=list)
+    net_deltas: array = field(default_factory=lambda: array("d"))
+    timestamps_ns: array = field(default_factory=lambda: array("q"))
+
+    def register_trade(self, trade: TradeRecord) -> None:
+        self.order_ids.append(trade.order_id)
+        self.statuses.append(trade.status)
+        self.product_ids.append(trade.product_id)
+        self.actions.append(trade.action)
+        self.amounts_usdc.append(trade.amount_usdc)
+        self.filled_sizes.append(trade.filled_size)
+        self.avg_prices.append(trade.avg_price)
+        self.net_deltas.append(trade.net_delta_usdc)
+        self.timestamps_ns.append(trade.timestamp_ns)
+        self.net_profit_usdc += trade.net_delta_usdc
 
     @property
     def transaction_count(self) -> int:
-        return len(self.transactions)
+        return len(self.order_ids)
+
+    def as_records(self) -> List[TradeRecord]:
+        """Rebuild the registered trades in order."""
+        columns = zip(
+            self.order_ids,
+            self.statuses,
+            self.product_ids,
+            self.actions,
+            self.amounts_usdc,
+            self.filled_sizes,
+            self.avg_prices,
+            self.net_deltas,
+            self.timestamps_ns,
+        )
+        return [TradeRecord(*row) for row in columns]
 
 
 class TradingAgent:
     """Coordinates Coinbase, the LLM, and the journal to run trades."""
 
-    def __init__(self, config: AgentConfig) -> None:
+    def __init__(self, config: AgentConfig, *, semaphore: Optional[asyncio.Semaphore] = None) -> None:
         self._config = config
-        self._llm = LLMDecisionMaker(config.llm)
-        self._client = CoinbaseClient()
+        self._llm = LLMDecisionMaker(config.llm, price_resolution=config.coinbase.price_move_threshold)
+        client = CoinbaseClient(
+            price_ttl_seconds=config.coinbase.price_cache_ttl_seconds,
+            balance_ttl_seconds=config.coinbase.balance_cache_ttl_seconds,
+            timeout_seconds=config.coinbase.request_timeout_seconds,
+        )
+        # One bounded pool runs every blocking SDK and LLM call so they can overlap.
+        self._executor = ThreadPoolExecutor(max_workers=_MAX_WORKERS, thread_name_prefix="home-trader")
+        self._client = AsyncCoinbaseClient(client, semaphore=semaphore, executor=self._executor)
+        self._stream: Optional[CoinbaseWSClient] = None
+        if config.coinbase.stream_prices:
+            self._stream = CoinbaseWSClient(
+                on_price=self._client.record_price,
+                move_threshold=config.coinbase.price_move_threshold,
+            )
         self._ledger = TradeLedger()
         self._journal: Optional[Journal] = None
-        self._start_time: Optional[float] = None
+        self._deadline: Optional[float] = None
+        self._stopped: Optional[asyncio.Event] = None
+        # Seen by worker threads; tells an in-flight LLM stream to stop reading.
+        self._halted = threading.Event()
+        self._const_constraints: Mapping[str, Any] = MappingProxyType({})
+        self._price_prefetch: Optional[Tuple[str, asyncio.Task]] = None
+        self._last_candidates: List[str] = []
+        self._unpriced: FrozenSet[str] = frozenset()
+        self._no_price: TTLCache[bool] = TTLCache(_UNPRICED_RECHECK_SECONDS)
 
     def initialize_session(self, journal: Journal) -> None:
         self._journal = journal
-        self._start_time = time.time()
+        # Monotonic, so wall-clock steps cannot end the session early or late.
+        self._deadline = time.monotonic() + self._config.constraints.max_runtime.total_seconds()
         metadata = {
-            "session_id": str(uuid.uuid4()),
-            "start_time": datetime.utcnow().isoformat(),
+            "session_id": uuid.uuid4().hex,
+            "start_time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
             "max_runtime": str(self._config.constraints.max_runtime),
             "profit_target_usdc": self._config.constraints.profit_target_usdc,
             "max_transactions": self._config.constraints.max_transactions,
             "max_purchase_usdc": self._config.constraints.max_purchase_usdc,
-            "forbidden_products": self._config.forbidden_products,
+            "forbidden_products": sorted(self._config.forbidden_products),
         }
+        c = self._config.constraints
+        self._const_constraints = MappingProxyType(
+            {
+                "max_runtime_hours": c.max_runtime.total_seconds() / 3600,
+                "profit_target_usdc": c.profit_target_usdc,
+                "max_transactions": c.max_transactions,
+                "max_purchase_usdc": c.max_purchase_usdc,
+                "forbidden_products": metadata["forbidden_products"],
+            }
+        )
         journal.log_header(metadata)
-        journal.append_entry("Session Started", json.dumps(metadata, indent=2))
-
-    def run(self) -> None:
-        if not self._journal or self._start_time is None:
+        journal.append_entry("Session Started", orjson.dumps(metadata, option=orjson.OPT_INDENT_2).decode("utf-8"))
+
+    def close(self) -> None:
+        """Release network resources held by the Coinbase and LLM clients."""
+        # Workers must finish before the sessions they use are closed.
+        self._halted.set()
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._client.close()
+        self._llm.close()
+
+    def run_sync(self) -> None:
+        """Run the trading loop to completion from synchronous code."""
+        asyncio.run(self.run())
+
+    async def run(self) -> None:
+        if not self._journal or self._deadline is None:
             raise RuntimeError("Session not initialized. Call initialize_session first.")
 
+        # The deadline fires on the loop's monotonic clock, so a session that is
+        # waiting on the LLM or the next cycle stops as soon as the runtime is up.
+        self._stopped = asyncio.Event()
+        loop = asyncio.get_running_loop()
+        deadline_timer = loop.call_later(max(0.0, self._deadline - time.monotonic()), self._halt)
+        with self._journal:
+            await self._open_stream()
+            try:
+                await self._run_cycles()
+            finally:
+                deadline_timer.cancel()
+                # Abandon any LLM stream still running on a worker thread.
+                self._halted.set()
+                await self._close_stream()
+
+    def _halt(self) -> None:
+        assert self._stopped is not None
+        self._stopped.set()
+        self._halted.set()
+
+    async def _run_cycles(self) -> None:
+        journal = self._journal
+        assert journal is not None
+        llm = self._llm
+        executor = self._executor
+        max_context_bytes = self._config.llm.max_context_bytes
+        loop = asyncio.get_running_loop()
+
+        def on_partial(action: str, product_id: Optional[str]) -> None:
+            loop.call_soon_threadsafe(self._prefetch_price, action, product_id)
+
         while True:
             reason = self._stop_reason()
             if reason:
-                self._journal.append_entry("Session Complete", reason)
+                journal.append_entry("Session Complete", reason)
                 break
 
-            snapshot = self._build_market_snapshot()
-            constraints = self._build_constraints_payload()
-            decision = self._llm.decide(
-                journal_contents=self._journal.read_contents(),
-                market_snapshot=snapshot.to_dict(),
-                constraints=constraints,
+            snapshot = await self._build_market_snapshot()
+            decided = await self._unless_stopped(
+                llm.adecide(
+                    journal_contents=journal.tail(max_context_bytes),
+                    market_snapshot=snapshot.to_dict(),
+                    constraints=self._build_constraints_payload(),
+                    executor=executor,
+                    on_partial=on_partial,
+                    cancel=self._halted,
+                )
             )
-            self._journal.append_decision(decision.action, decision.rationale)
-
-            if decision.action == "hold":
-                time.sleep(self._config.polling_interval_seconds)
+            if decided is None:
+                # Out of time; the worker abandons the stream and the loop reports why.
+                self._discard_prefetch()
                 continue
-
-            if not decision.product_id:
-                self._journal.append_entry(
-                    "Decision Skipped",
-                    "LLM suggested a trade without specifying a product. Action ignored.",
-                )
-                time.sleep(self._config.polling_interval_seconds)
+            try:
+                decision = decided.result()
+            except DecisionCancelled:
+                # The worker saw the stop before the stop event won the race.
+                self._discard_prefetch()
                 continue
-
-            product_id = decision.product_id.upper()
-            if not product_id.endswith("-USDC"):
-                product_id = f"{product_id}-USDC"
-
-            if not self._validate_decision(decision, product_id):
-                time.sleep(self._config.polling_interval_seconds)
+            except ValueError as exc:
+                self._discard_prefetch()
+                journal.append_entry("Decision Skipped", f"LLM returned an unusable decision: {exc}")
+                await self._wait_for_next_cycle()
+                continue
+            journal.append_decision(decision.action, decision.rationale, cached=decision.cached)
+
+            match decision.action:
+                case "hold":
+                    self._discard_prefetch()
+                    await self._wait_for_next_cycle()
+                    continue
+                case "sell":
+                    # Balances only change through our own orders, so the snapshot's
+                    # balances are still current; a sell needs one fresh price, reused
+                    # for both validation and order sizing.
+                    product_id, base_asset = _canon_product(decision.product_id)
+                    price = await self._sell_price(product_id, base_asset, snapshot)
+                    if price is None:
+                        await self._wait_for_next_cycle()
+                        continue
+                case "buy":
+                    product_id, base_asset = _canon_product(decision.product_id)
+                    price = None
+                    self._discard_prefetch()
+                case _:
+                    self._discard_prefetch()
+                    journal.append_entry("Decision Rejected", f"Unsupported action: {decision.action}")
+                    await self._wait_for_next_cycle()
+                    continue
+
+            if not self._validate_decision(decision, product_id, base_asset, snapshot, price):
+                await self._wait_for_next_cycle()
                 continue
 
-            trade_result = self._execute_trade(decision, product_id)
-            if trade_result:
-                self._ledger.register_trade(trade_result)
-                self._journal.append_transaction(trade_result)
+            trade = await self._execute_trade(decision, product_id, price)
+            self._ledger.register_trade(trade)
+            journal.append_transaction(trade.to_dict())
 
-                reason = self._stop_reason()
-                if reason:
-                    self._journal.append_entry("Session Complete", reason)
-                    break
+            reason = self._stop_reason()
+            if reason:
+                journal.append_entry("Session Complete", reason)
+                break
 
-            time.sleep(self._config.polling_interval_seconds)
+            await self._wait_for_next_cycle()
+
+    def _prefetch_price(self, action: str, product_id: Optional[str]) -> None:
+        """Start fetching a sell price while the LLM is still writing its rationale."""
+        if action != "sell" or not product_id or self._price_prefetch is not None:
+            return
+        product_id, _ = _canon_product(product_id)
+        task = asyncio.create_task(self._client.get_product_price(product_id))
+        self._price_prefetch = (product_id, task)
+
+    async def _sell_price(self, product_id: str, base_asset: str, snapshot: MarketSnapshot) -> Optional[float]:
+        """Price a sell, or journal a rejection and return ``None`` if it cannot proceed."""
+        assert self._journal is not None
+        if base_asset in self._config.forbidden_products:
+            reason = f"Product {product_id} is forbidden."
+        elif product_id not in snapshot.open_positions:
+            reason = f"No {base_asset} position to sell."
+        else:
+            try:
+                return await self._take_prefetched_price(product_id)
+            except (RuntimeError, OSError) as exc:
+                # Unknown products and failed lookups; requests errors are OSErrors.
+                self._journal.append_entry("Decision Rejected", f"No USDC price for {product_id}: {exc}")
+                return None
+        self._discard_prefetch()
+        self._journal.append_entry("Decision Rejected", reason)
+        return None
+
+    async def _take_prefetched_price(self, product_id: str) -> float:
+        prefetch, self._price_prefetch = self._price_prefetch, None
+        if prefetch is not None:
+            prefetched_id, task = prefetch
+            if prefetched_id == product_id:
+                return await task
+            self._cancel_task(task)
+        return await self._client.get_product_price(product_id)
+
+    def _discard_prefetch(self) -> None:
+        prefetch, self._price_prefetch = self._price_prefetch, None
+        if prefetch is not None:
+            self._cancel_task(prefetch[1])
+
+    @staticmethod
+    def _cancel_task(task: asyncio.Task) -> None:
+        if task.done():
+            # Retrieve any error so it is not reported as never retrieved.
+            if not task.cancelled():
+                task.exception()
+            return
+        task.cancel()
+
+    async def _wait_for_next_cycle(self) -> None:
+        """Wait for a significant price move, or at most one polling interval."""
+        interval = self._config.polling_interval_seconds
+        if self._stream is None:
+            await self._unless_stopped(asyncio.sleep(interval))
+            return
+        events = self._stream.events
+        if await self._unless_stopped(events.get(), timeout=interval) is None:
+            return
+        # Coalesce a burst of moves into a single wake-up.
+        while not events.empty():
+            events.get_nowait()
+
+    async def _unless_stopped(
+        self, awaitable: Awaitable[Any], timeout: Optional[float] = None
+    ) -> Optional[asyncio.Future]:
+        """Await ``awaitable`` until it finishes, the session stops, or ``timeout`` passes.
+
+        Returns the finished future, or ``None`` when it was cut short.
+        """
+        assert self._stopped is not None
+        future = asyncio.ensure_future(awaitable)
+        stopped = asyncio.ensure_future(self._stopped.wait())
+        try:
+            await asyncio.wait((future, stopped), timeout=timeout, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            stopped.cancel()
+            if not future.done():
+                future.cancel()
+        return future if future.done() and not future.cancelled() else None
+
+    async def _open_stream(self) -> None:
+        if self._stream is None:
+            return
+        try:
+            await self._stream.open()
+        except MarketStreamError as exc:
+            self._disable_stream(exc)
+
+    async def _close_stream(self) -> None:
+        if self._stream is None:
+            return
+        try:
+            await self._stream.close()
+        except MarketStreamError:
+            pass
+        self._stream = None
+
+    async def _track_products(self, product_ids: List[str]) -> None:
+        if self._stream is None:
+            return
+        try:
+            await self._stream.track(product_ids)
+        except MarketStreamError as exc:
+            await self._close_stream()
+            self._disable_stream(exc)
+
+    def _disable_stream(self, exc: Exception) -> None:
+        self._stream = None
+        assert self._journal is not None
+        self._journal.append_entry(
+            "Market Stream Unavailable",
+            f"Falling back to polling every {self._config.polling_interval_seconds}s: {exc}",
+        )
 
     def _stop_reason(self) -> Optional[str]:
-        assert self._start_time is not None
-        elapsed = time.time() - self._start_time
-        constraints = self._config.constraints
-        if elapsed >= constraints.max_runtime.total_seconds():
+        assert self._deadline is not None and self._stopped is not None
+        if self._stopped.is_set() or time.monotonic() >= self._deadline:
             return "Max runtime reached."
+        constraints = self._config.constraints
         if self._ledger.transaction_count >= constraints.max_transactions:
             return "Max transaction count reached."
         if self._ledger.net_profit_usdc >= constraints.profit_target_usdc:
@@ -137,49 +439,82 @@ class TradingAgent:
         return None
 
     def _build_constraints_payload(self) -> Dict[str, Any]:
-        c = self._config.constraints
         return {
-            "max_runtime_hours": c.max_runtime.total_seconds() / 3600,
-            "profit_target_usdc": c.profit_target_usdc,
-            "max_transactions": c.max_transactions,
-            "max_purchase_usdc": c.max_purchase_usdc,
-            "forbidden_products": self._config.forbidden_products,
-            "remaining_transactions": c.max_transactions - self._ledger.transaction_count,
+            **self._const_constraints,
+            "remaining_transactions": self._config.constraints.max_transactions - self._ledger.transaction_count,
             "current_profit_usdc": self._ledger.net_profit_usdc,
         }
 
-    def _build_market_snapshot(self) -> MarketSnapshot:
-        accounts = self._client.get_accounts()
-        usdc_balance = next((a.available_balance for a in accounts if a.asset.upper() == "USDC"), 0.0)
-        candidate_products = self._discover_candidate_products(accounts)
-        open_positions = self._estimate_positions(accounts, candidate_products)
+    async def _build_market_snapshot(self) -> MarketSnapshot:
+        # Holdings rarely change between cycles, so last cycle's products are
+        # priced while the accounts load; the fetch below then mostly hits the cache.
+        warm = self._last_candidates if self._config.coinbase.price_cache_ttl_seconds > 0 else []
+        accounts, _ = await asyncio.gather(self._client.get_accounts(), self._warm_prices(warm))
+        usdc_balance, holdings = self._index_accounts(accounts)
+        open_positions = {f"{asset}{_QUOTE_SUFFIX}": holdings[asset] for asset in sorted(holdings)}
+        # Holdings without a USDC market (e.g. fiat wallets) are left unpriced, and
+        # skipped by later fetches until the recheck interval passes.
+        to_price = [pid for pid in open_positions if not self._no_price.get(pid)]
+        # Ticker subscriptions and the REST price fetch are independent; overlap them.
+        _, prices = await asyncio.gather(
+            self._track_products(to_price),
+            self._client.get_prices(to_price, skip_missing=True),
+        )
+        for product_id in to_price:
+            if product_id not in prices:
+                self._no_price.set(product_id, True)
+        candidate_products = [pid for pid in open_positions if pid in prices]
+        self._last_candidates = candidate_products
+        self._note_unpriced(frozenset(open_positions).difference(prices))
         return MarketSnapshot(
             usdc_balance=usdc_balance,
             candidate_products=candidate_products,
             open_positions=open_positions,
+            prices=prices,
         )
 
-    def _discover_candidate_products(self, accounts: List[Any]) -> List[str]:
-        products = set()
-        for account in accounts:
-            asset = account.asset.upper()
-            if asset in self._config.forbidden_products or asset == "USDC":
-                continue
-            products.add(f"{asset}-USDC")
-        return sorted(products)
+    async def _warm_prices(self, product_ids: List[str]) -> None:
+        if not product_ids:
+            return
+        # Best effort: the authoritative fetch retries and reports any failure.
+        with contextlib.suppress(Exception):
+            await self._client.get_prices(product_ids, skip_missing=True)
+
+    def _note_unpriced(self, unpriced: FrozenSet[str]) -> None:
+        """Journal holdings without a USDC price, once per change rather than per cycle."""
+        if unpriced == self._unpriced:
+            return
+        self._unpriced = unpriced
+        if unpriced:
+            assert self._journal is not None
+            self._journal.append_entry(
+                "Prices Unavailable",
+                f"No USDC price for {', '.join(sorted(unpriced))}; excluded from candidate products.",
+            )
 
-    def _estimate_positions(self, accounts: List[Any], products: List[str]) -> Dict[str, float]:
+    def _index_accounts(self, accounts: List[AccountBalance]) -> Tuple[float, Dict[str, float]]:
+        """Split accounts into the USDC balance and tradable holdings in one pass."""
+        usdc_balance = 0.0
         holdings: Dict[str, float] = {}
+        forbidden = self._config.forbidden_products
         for account in accounts:
             asset = account.asset.upper()
-            if asset in self._config.forbidden_products or asset == "USDC":
-                continue
-            holdings[asset] = account.available_balance
-        return {product: holdings.get(product.split("-")[0], 0.0) for product in products}
-
-    def _validate_decision(self, decision, product_id: str) -> bool:
+            if asset == "USDC":
+                usdc_balance = account.available_balance
+            elif asset not in forbidden:
+                holdings[asset] = account.available_balance
+        return usdc_balance, holdings
+
+    def _validate_decision(
+        self,
+        decision,
+        product_id: str,
+        base_asset: str,
+        snapshot: MarketSnapshot,
+        price: Optional[float],
+    ) -> bool:
         constraints = self._config.constraints
-        if product_id.split("-")[0] in self._config.forbidden_products:
+        if base_asset in self._config.forbidden_products:
             self._journal.append_entry("Decision Rejected", f"Product {product_id} is forbidden.")
             return False
 
@@ -187,14 +522,6 @@ class TradingAgent:
             self._journal.append_entry("Decision Rejected", "Max transaction count reached.")
             return False
 
-        if decision.action not in {"buy", "sell"}:
-            self._journal.append_entry("Decision Rejected", f"Unsupported action: {decision.action}")
-            return False
-
-        if decision.amount_usdc is None or decision.amount_usdc <= 0:
-            self._journal.append_entry("Decision Rejected", "Invalid trade size specified.")
-            return False
-
         if decision.action == "buy" and decision.amount_usdc > constraints.max_purchase_usdc:
             self._journal.append_entry(
                 "Decision Rejected",
@@ -203,15 +530,12 @@ class TradingAgent:
             return False
 
         if decision.action == "buy":
-            balance = self._client.get_usdc_balance()
-            if decision.amount_usdc > balance:
+            if decision.amount_usdc > snapshot.usdc_balance:
                 self._journal.append_entry("Decision Rejected", "Insufficient USDC balance for purchase.")
                 return False
         else:
-            base_asset = product_id.split("-")[0]
-            accounts = self._client.get_accounts()
-            base_balance = next((a.available_balance for a in accounts if a.asset.upper() == base_asset), 0.0)
-            price = self._client.get_product_price(product_id)
+            base_balance = snapshot.open_positions.get(product_id, 0.0)
+            assert price is not None
             required_base = decision.amount_usdc / price
             if required_base > base_balance:
                 self._journal.append_entry(
@@ -222,26 +546,28 @@ class TradingAgent:
 
         return True
 
-    def _execute_trade(self, decision, product_id: str) -> Optional[Dict[str, Any]]:
-        order_id = str(uuid.uuid4())
+    async def _execute_trade(
+        self, decision, product_id: str, price: Optional[float]
+    ) -> TradeRecord:
+        order_id = uuid.uuid4().hex
         if decision.action == "buy":
-            result = self._client.place_market_buy(product_id, decision.amount_usdc, order_id)
+            result = await self._client.place_market_buy(product_id, decision.amount_usdc, order_id)
             net_delta = -decision.amount_usdc
         else:
-            price = self._client.get_product_price(product_id)
+            assert price is not None
             base_size = decision.amount_usdc / price
-            result = self._client.place_market_sell(product_id, base_size, order_id)
+            result = await self._client.place_market_sell(product_id, base_size, order_id)
             net_delta = decision.amount_usdc
 
-        trade_record = {
-            "order_id": result.order_id,
-            "status": result.status,
-            "product_id": product_id,
-            "action": decision.action,
-            "amount_usdc": decision.amount_usdc,
-            "filled_size": result.filled_size,
-            "avg_price": result.avg_price,
-            "net_delta_usdc": net_delta,
-            "timestamp": datetime.utcnow().isoformat(),
-        }
-        return trade_record
+        return TradeRecord(
+            order_id=result.order_id,
+            status=result.status,
+            product_id=product_id,
+            action=decision.action,
+            amount_usdc=decision.amount_usdc,
+            filled_size=result.filled_size,
+            avg_price=result.avg_price,
+            net_delta_usdc=net_delta,
+            # The journal entry heading already carries a readable UTC time.
+            timestamp_ns=time.time_ns(),
+        )
@@ -0,0 +1,65 @@
+"""Tests for the TTL cache."""
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from home_trader.cache import TTLCache
+
+
+class TTLCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now = 1_000.0
+        patcher = mock.patch("home_trader.cache.time.monotonic", side_effect=lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_value_expires_after_ttl(self) -> None:
+        cache: TTLCache[int] = TTLCache(10.0)
+        cache.set("a", 1)
+
+        self.now += 9.9
+        self.assertEqual(cache.get("a"), 1)
+        self.now += 0.1
+        self.assertIsNone(cache.get("a"))
+
+    def test_non_positive_ttl_disables_caching(self) -> None:
+        cache: TTLCache[int] = TTLCache(0.0)
+        cache.set("a", 1)
+
+        self.assertIsNone(cache.get("a"))
+
+    def test_oldest_entry_is_evicted_at_capacity(self) -> None:
+        cache: TTLCache[int] = TTLCache(10.0, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("c", 3)
+
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_resetting_a_key_makes_it_newest(self) -> None:
+        cache: TTLCache[int] = TTLCache(10.0, max_entries=2)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.set("a", 10)
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 10)
+        self.assertIsNone(cache.get("b"))
+
+    def test_invalidate_one_key_or_all(self) -> None:
+        cache: TTLCache[int] = TTLCache(10.0)
+        cache.set("a", 1)
+        cache.set("b", 2)
+
+        cache.invalidate("a")
+        self.assertIsNone(cache.get("a"))
+        self.assertEqual(cache.get("b"), 2)
+        cache.invalidate()
+        self.assertIsNone(cache.get("b"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,72 @@
+"""Tests for the in-memory journal tail."""
+from __future__ import annotations
+
+import tempfile
+import unittest
+from pathlib import Path
+
+from home_trader.journal import Journal
+
+
+class JournalTailTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self._tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self._tmp.cleanup)
+        self.journal = Journal(path=Path(self._tmp.name) / "journal.md")
+
+    def test_returns_newest_whole_entries_within_budget(self) -> None:
+        for index in range(3):
+            self.journal.append_entry(f"Entry {index}", "x" * 40)
+        newest = self.journal.tail(10_000).split("## ")[-1]
+
+        tail = self.journal.tail(len(newest.encode("utf-8")) + 10)
+
+        self.assertTrue(tail.startswith("## Entry 2 "))
+        self.assertNotIn("Entry 1", tail)
+
+    def test_includes_everything_when_budget_allows(self) -> None:
+        self.journal.append_entry("First", "a")
+        self.journal.append_entry("Second", "b")
+
+        self.assertEqual(self.journal.tail(10_000), self.journal.read_contents())
+
+    def test_truncates_oversized_newest_entry(self) -> None:
+        self.journal.append_entry("Older", "small")
+        self.journal.append_entry("Huge", "y" * 20_000)
+
+        tail = self.journal.tail(1_024)
+
+        self.assertTrue(tail.startswith("## Huge "))
+        self.assertEqual(len(tail.encode("utf-8")), 1_024)
+
+    def test_truncation_does_not_split_multibyte_characters(self) -> None:
+        self.journal.append_entry("Huge", "é" * 5_000)
+
+        tail = self.journal.tail(101)
+
+        self.assertLessEqual(len(tail.encode("utf-8")), 101)
+        self.assertTrue(tail.startswith("## Huge "))
+
+    def test_appends_reach_disk_through_the_writer(self) -> None:
+        with self.journal:
+            self.journal.append_entry("Decision", "hold")
+        self.assertIn("## Decision ", self.journal.path.read_text(encoding="utf-8"))
+
+
+class JournalWriterTests(unittest.TestCase):
+    def test_failed_write_raises_on_next_append(self) -> None:
+        with tempfile.TemporaryDirectory() as tmp:
+            # The parent directory does not exist, so the writer's open fails at once.
+            journal = Journal(path=Path(tmp) / "missing" / "journal.md")
+            journal.__enter__()
+            assert journal._writer is not None
+            journal._writer._thread.join(timeout=5)
+
+            with self.assertRaises(OSError):
+                journal.append_entry("Decision", "hold")
+            # Already reported to the caller, so closing does not raise it again.
+            journal.__exit__(None, None, None)
+
+
+if __name__ == "__main__":
+    unittest.main()
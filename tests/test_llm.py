@@ -0,0 +1,162 @@
+"""Tests for LLM response handling, without a running Ollama server."""
+from __future__ import annotations
+
+import threading
+import unittest
+from typing import Any, Dict, List, Optional
+from unittest import mock
+
+import orjson
+
+from home_trader.config import LLMConfig
+from home_trader.llm import DecisionCancelled, LLMDecisionMaker
+
+
+class _FakeResponse:
+    """Streams ``tokens`` the way Ollama's /api/generate does."""
+
+    def __init__(self, tokens: List[str]) -> None:
+        self._tokens = tokens
+        self.read = 0
+        self.closed = False
+
+    def __enter__(self) -> "_FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.closed = True
+
+    def raise_for_status(self) -> None:
+        pass
+
+    def iter_lines(self):
+        for index, token in enumerate(self._tokens):
+            self.read += 1
+            yield orjson.dumps({"response": token, "done": index == len(self._tokens) - 1})
+
+
+def _reply(action: str, product_id: Optional[str] = None, amount_usdc: Optional[float] = None) -> str:
+    return orjson.dumps(
+        {"action": action, "product_id": product_id, "amount_usdc": amount_usdc, "rationale": "test"}
+    ).decode("utf-8")
+
+
+def _snapshot(price: float) -> Dict[str, Any]:
+    return {
+        "usdc_balance": 100.0,
+        "open_positions": {"DOGE-USDC": 10.0},
+        "candidate_products": ["DOGE-USDC"],
+        "prices": {"DOGE-USDC": price},
+    }
+
+
+class HoldCacheTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm = LLMDecisionMaker(LLMConfig(hold_cache_ttl_seconds=300.0), price_resolution=0.005)
+        self.addCleanup(self.llm.close)
+        self.post = mock.Mock(side_effect=lambda *args, **kwargs: _FakeResponse([_reply("hold")]))
+        self.llm._session.post = self.post
+
+    def _decide(self, price: float):
+        return self.llm.decide(journal_contents="", market_snapshot=_snapshot(price), constraints={"c": 1})
+
+    def test_hold_is_reused_and_marked_cached(self) -> None:
+        first = self._decide(0.2)
+        second = self._decide(0.2)
+
+        self.assertEqual(self.post.call_count, 1)
+        self.assertFalse(first.cached)
+        self.assertTrue(second.cached)
+        self.assertEqual(second.action, "hold")
+
+    def test_price_move_beyond_resolution_asks_again(self) -> None:
+        self._decide(0.2)
+        self._decide(0.21)
+
+        self.assertEqual(self.post.call_count, 2)
+
+    def test_trades_are_not_cached(self) -> None:
+        self.post.side_effect = lambda *args, **kwargs: _FakeResponse([_reply("buy", "DOGE", 5.0)])
+        self._decide(0.2)
+        decision = self._decide(0.2)
+
+        self.assertEqual(self.post.call_count, 2)
+        self.assertFalse(decision.cached)
+
+
+class ParseResponseTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm = LLMDecisionMaker(LLMConfig())
+        self.addCleanup(self.llm.close)
+
+    def test_parses_hold_and_trade(self) -> None:
+        hold = self.llm._parse_response(_reply("HOLD"))
+        trade = self.llm._parse_response(_reply("sell", "DOGE-USDC", 12))
+
+        self.assertEqual((hold.action, hold.product_id, hold.amount_usdc), ("hold", None, None))
+        self.assertEqual((trade.action, trade.product_id, trade.amount_usdc), ("sell", "DOGE-USDC", 12.0))
+
+    def test_rejects_malformed_shapes(self) -> None:
+        bad_replies = {
+            "not json": "nope",
+            "string": '"hold"',
+            "array": "[]",
+            "non-string action": '{"action": 5}',
+            "unknown action": _reply("short", "DOGE", 5),
+            "missing product": _reply("buy", None, 5),
+            "non-string product": '{"action": "buy", "product_id": 7, "amount_usdc": 5}',
+            "missing amount": _reply("buy", "DOGE", None),
+            "boolean amount": '{"action": "buy", "product_id": "DOGE", "amount_usdc": true}',
+            "string amount": '{"action": "buy", "product_id": "DOGE", "amount_usdc": "5"}',
+            "zero amount": _reply("buy", "DOGE", 0),
+            "negative amount": _reply("sell", "DOGE", -1),
+            "infinite amount": '{"action": "buy", "product_id": "DOGE", "amount_usdc": 1e999}',
+        }
+        for label, reply in bad_replies.items():
+            with self.subTest(label), self.assertRaises(ValueError):
+                self.llm._parse_response(reply)
+
+
+class ReadStreamTests(unittest.TestCase):
+    def setUp(self) -> None:
+        self.llm = LLMDecisionMaker(LLMConfig())
+        self.addCleanup(self.llm.close)
+
+    def test_stops_reading_once_the_reply_is_complete(self) -> None:
+        reply = _reply("hold")
+        response = _FakeResponse([reply[:10], reply[10:], " trailing", " tokens"])
+
+        self.assertEqual(self.llm._read_stream(response), reply)
+        self.assertEqual(response.read, 2)
+
+    def test_reports_action_and_product_once(self) -> None:
+        reply = _reply("sell", "DOGE-USDC", 5)
+        seen = []
+        response = _FakeResponse([reply[i : i + 4] for i in range(0, len(reply), 4)])
+
+        self.llm._read_stream(response, lambda action, product_id: seen.append((action, product_id)))
+
+        self.assertEqual(seen, [("sell", "DOGE-USDC")])
+
+    def test_cancel_abandons_the_stream(self) -> None:
+        cancel = threading.Event()
+        cancel.set()
+        response = _FakeResponse(["{", '"action"', ': "hold"}'])
+
+        with self.assertRaises(DecisionCancelled):
+            self.llm._read_stream(response, cancel=cancel)
+        self.assertEqual(response.read, 1)
+
+    def test_cancel_closes_the_response_in_decide(self) -> None:
+        cancel = threading.Event()
+        cancel.set()
+        response = _FakeResponse([_reply("hold")])
+        self.llm._session.post = mock.Mock(return_value=response)
+
+        with self.assertRaises(DecisionCancelled):
+            self.llm.decide(journal_contents="", market_snapshot=_snapshot(0.2), constraints={}, cancel=cancel)
+        self.assertTrue(response.closed)
+
+
+if __name__ == "__main__":
+    unittest.main()